@@ -1,44 +1,89 @@
 """Custom resource handler for Quick Suite setup with IAM Identity Center."""
 
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 import boto3
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from crhelper import CfnResource
 
 from common.observability import logger
 
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+_CFG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    request_checksum_calculation="when_required",
+    response_checksum_validation="when_required",
+)
+
 helper = CfnResource()
-quicksight = boto3.client("quicksight")
-identitystore = boto3.client("identitystore")
+_client_lock = threading.Lock()
+_clients: dict[str, "BaseClient"] = {}
 
+_INACTIVE_SUBSCRIPTION_STATUSES = frozenset({"UNSUBSCRIBED", "UNSUBSCRIBE_IN_PROGRESS"})
 
-def get_existing_group_id(identity_store_id: str, group_name: str) -> str | None:  # noqa: D103
-    paginator = identitystore.get_paginator("list_groups")
-    page_iterator = paginator.paginate(
-        IdentityStoreId=identity_store_id, Filters=[{"AttributePath": "DisplayName", "AttributeValue": group_name}]
-    )
+# Group IDs found in earlier invocations of a warm container, keyed by (identity store ID, group name).
+_group_id_cache: dict[tuple[str, str], str] = {}
+
+
+# Clients are created on first use so invocations that never call AWS (such as delete) skip construction.
+# Construction happens under the lock, with a second lookup, because the default boto3 session is not
+# thread-safe and threads racing on the first call must share one client and connection pool.
+def _client(service_name: str) -> "BaseClient":
+    client = _clients.get(service_name)
+    if client is None:
+        with _client_lock:
+            client = _clients.get(service_name)
+            if client is None:
+                client = _clients[service_name] = boto3.client(service_name, config=_CFG)
+    return client
+
+
+def _quicksight() -> "BaseClient":
+    return _client("quicksight")
+
+
+def _identitystore() -> "BaseClient":
+    return _client("identitystore")
 
-    for page in page_iterator:
-        if page["Groups"]:
-            return page["Groups"][0]["GroupId"]
 
-    return None
+def get_existing_group_id(identity_store_id: str, group_name: str) -> str | None:  # noqa: D103
+    cached_group_id = _group_id_cache.get((identity_store_id, group_name))
+    if cached_group_id:
+        return cached_group_id
+
+    try:
+        response = _identitystore().get_group_id(
+            IdentityStoreId=identity_store_id,
+            AlternateIdentifier={"UniqueAttribute": {"AttributePath": "DisplayName", "AttributeValue": group_name}},
+        )
+    except ClientError as error:
+        if error.response["Error"]["Code"] == "ResourceNotFoundException":
+            return None
+        raise
+    else:
+        _group_id_cache[identity_store_id, group_name] = response["GroupId"]
+        return response["GroupId"]
 
 
 def create_identity_store_group(identity_store_id: str, group_name: str) -> str:  # noqa: D103
-    response = identitystore.create_group(
+    response = _identitystore().create_group(
         IdentityStoreId=identity_store_id, DisplayName=group_name, Description="Quick Suite Admin Pro Group"
     )
     group_id = response["GroupId"]
+    _group_id_cache[identity_store_id, group_name] = group_id
     logger.info(f"Created group {group_name} with ID {group_id}")
     return group_id
 
 
-def ensure_identity_store_group(identity_store_id: str, group_name: str) -> str:  # noqa: D103
-    existing_group_id = get_existing_group_id(identity_store_id, group_name)
-
+def ensure_identity_store_group(identity_store_id: str, group_name: str, existing_group_id: str | None) -> str:  # noqa: D103
     if existing_group_id:
         logger.info(f"Group {group_name} already exists with ID {existing_group_id}")
         return existing_group_id
@@ -48,20 +93,20 @@ def ensure_identity_store_group(identity_store_id: str, group_name: str) -> str:
 
 def check_quicksight_subscription_exists(account_id: str) -> bool:  # noqa: D103
     try:
-        response = quicksight.describe_account_subscription(AwsAccountId=account_id)
+        response = _quicksight().describe_account_subscription(AwsAccountId=account_id)
         status = response["AccountInfo"]["AccountSubscriptionStatus"]
     except ClientError as error:
         if error.response["Error"]["Code"] == "ResourceNotFoundException":
             return False
         raise
     else:
-        return status not in ["UNSUBSCRIBED", "UNSUBSCRIBE_IN_PROGRESS"]
+        return status not in _INACTIVE_SUBSCRIPTION_STATUSES
 
 
 def create_quicksight_subscription(  # noqa: D103
     account_id: str, account_name: str, admin_email: str, identity_center_arn: str, admin_group_name: str
 ) -> None:
-    quicksight.create_account_subscription(
+    _quicksight().create_account_subscription(
         Edition="ENTERPRISE",
         AuthenticationMethod="IAM_IDENTITY_CENTER",
         AwsAccountId=account_id,
@@ -73,10 +118,16 @@ def create_quicksight_subscription(  # noqa: D103
     logger.info("Quick Suite account subscription created")
 
 
-def ensure_quicksight_subscription(  # noqa: D103
-    account_id: str, account_name: str, admin_email: str, identity_center_arn: str, admin_group_name: str
+def ensure_quicksight_subscription(  # noqa: D103, PLR0913
+    account_id: str,
+    account_name: str,
+    admin_email: str,
+    identity_center_arn: str,
+    admin_group_name: str,
+    *,
+    subscription_exists: bool,
 ) -> None:
-    if check_quicksight_subscription_exists(account_id):
+    if subscription_exists:
         logger.info("Quick Suite account subscription already exists")
         return
 
@@ -94,8 +145,23 @@ def create(event: dict[str, Any], _context: LambdaContext) -> str:  # noqa: D103
     admin_email = props["AdminEmail"]
     admin_group_name = props["AdminGroupName"]
 
-    ensure_identity_store_group(identity_store_id, admin_group_name)
-    ensure_quicksight_subscription(account_id, account_name, admin_email, identity_center_arn, admin_group_name)
+    # The two existence checks are independent reads, so run them concurrently. The writes stay sequential
+    # because the subscription references the admin group.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        group_lookup = executor.submit(get_existing_group_id, identity_store_id, admin_group_name)
+        subscription_check = executor.submit(check_quicksight_subscription_exists, account_id)
+        existing_group_id = group_lookup.result()
+        subscription_exists = subscription_check.result()
+
+    ensure_identity_store_group(identity_store_id, admin_group_name, existing_group_id)
+    ensure_quicksight_subscription(
+        account_id,
+        account_name,
+        admin_email,
+        identity_center_arn,
+        admin_group_name,
+        subscription_exists=subscription_exists,
+    )
 
     return account_id
 
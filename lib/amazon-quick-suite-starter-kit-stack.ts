@@ -192,7 +192,7 @@ export class AmazonQuickSuiteStarterKitStack extends Stack {
       new PolicyStatement({
         effect: Effect.ALLOW,
         actions: [
-          'identitystore:ListGroups',
+          'identitystore:GetGroupId',
           'sso-directory:DescribeUser',
           'sso-directory:DescribeGroup',
           'sso:ListApplicationAssignments',
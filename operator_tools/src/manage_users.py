@@ -1,20 +1,59 @@
 """CLI tool for managing IAM Identity Center users and groups."""
 
-import json
 import sys
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum
+from functools import cache, lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
-import boto3
 import click
+import ijson
 from botocore.exceptions import ClientError
 from common.observability import logger
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, ValidationError, field_validator
 
-sso_admin = boto3.client("sso-admin")
-identitystore = boto3.client("identitystore")
-quicksight = boto3.client("quicksight")
-sts = boto3.client("sts")
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+    from botocore.config import Config
+
+# Clients are shared across worker threads; the connection pool is sized above the worker count.
+_MAX_WORKERS = 16
+_client_lock = threading.Lock()
+_clients: dict[str, "BaseClient"] = {}
+
+
+@cache
+def _config() -> "Config":
+    """Build the shared client config on first use; importing botocore.config pulls in most of botocore."""
+    from botocore.config import Config  # noqa: PLC0415
+
+    return Config(
+        retries={"mode": "adaptive", "max_attempts": 10},
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        request_checksum_calculation="when_required",
+        response_checksum_validation="when_required",
+    )
+
+
+def _client(service_name: str) -> "BaseClient":
+    """Create a boto3 client on first use so each command only pays for the clients it needs."""
+    client = _clients.get(service_name)
+    if client is not None:
+        return client
+
+    import boto3  # noqa: PLC0415
+
+    # The default session is not thread-safe, and workers racing on the first call must share one client
+    # (and its connection pool), so check again and build under the lock.
+    with _client_lock:
+        client = _clients.get(service_name)
+        if client is None:
+            client = _clients[service_name] = boto3.client(service_name, config=_config())
+    return client
 
 
 class QuickSuiteGroup(Enum):
@@ -25,6 +64,9 @@ class QuickSuiteGroup(Enum):
     PROFESSIONAL = "QUICK_SUITE_PRO"
 
 
+_QS_VALUES = frozenset(group.value for group in QuickSuiteGroup)
+_QS_VALUES_CSV = ", ".join(sorted(_QS_VALUES))
+
 QUICKSIGHT_ROLE_MAPPING = {
     QuickSuiteGroup.ADMIN.value: "ADMIN",
     QuickSuiteGroup.ENTERPRISE.value: "AUTHOR",
@@ -35,6 +77,8 @@ QUICKSIGHT_ROLE_MAPPING = {
 class CreateUserRequest(BaseModel):
     """Request model for creating a user."""
 
+    model_config = ConfigDict(frozen=True)
+
     username: str = Field(min_length=1, max_length=128)
     email: EmailStr
     given_name: str = Field(min_length=1, max_length=100)
@@ -45,22 +89,16 @@ class CreateUserRequest(BaseModel):
     @classmethod
     def validate_group(cls, v: str | None) -> str | None:
         """Validate group is a valid Quick Suite group."""
-        if v is not None and v not in [g.value for g in QuickSuiteGroup]:
-            valid_groups = ", ".join([g.value for g in QuickSuiteGroup])
-            raise ValueError(f"Group must be one of: {valid_groups}")
+        if v is not None and v not in _QS_VALUES:
+            raise ValueError(f"Group must be one of: {_QS_VALUES_CSV}")
         return v
 
 
-class UsersFile(BaseModel):
-    """Model for users configuration file."""
-
-    users: list[CreateUserRequest]
-
-
+@lru_cache(maxsize=1)
 def get_identity_store_id() -> str:
     """Get the Identity Store ID from IAM Identity Center instance."""
     try:
-        paginator = sso_admin.get_paginator("list_instances")
+        paginator = _client("sso-admin").get_paginator("list_instances")
         for page in paginator.paginate():
             instances = page.get("Instances", [])
             if instances:
@@ -78,84 +116,96 @@ def get_identity_store_id() -> str:
 def get_user_by_username(identity_store_id: str, username: str) -> dict | None:
     """Get user by username."""
     try:
-        paginator = identitystore.get_paginator("list_users")
-        for page in paginator.paginate(
+        response = _client("identitystore").get_user_id(
             IdentityStoreId=identity_store_id,
-            Filters=[{"AttributePath": "UserName", "AttributeValue": username}],
-        ):
-            users = page.get("Users", [])
-            if users:
-                return users[0]
-        return None  # noqa: TRY300
+            AlternateIdentifier={"UniqueAttribute": {"AttributePath": "UserName", "AttributeValue": username}},
+        )
     except ClientError as e:
+        if e.response["Error"]["Code"] == "ResourceNotFoundException":
+            return None
         logger.exception("Failed to get user", extra={"username": username, "error": str(e)})
         return None
+    return {"UserId": response["UserId"]}
 
 
+@lru_cache(maxsize=32)
 def get_group_id(identity_store_id: str, group_name: str) -> str | None:
-    """Get group ID by name."""
+    """Get group ID by name, or None if the group does not exist."""
     try:
-        paginator = identitystore.get_paginator("list_groups")
-        for page in paginator.paginate(
+        response = _client("identitystore").get_group_id(
             IdentityStoreId=identity_store_id,
-            Filters=[{"AttributePath": "DisplayName", "AttributeValue": group_name}],
-        ):
-            groups = page.get("Groups", [])
-            if groups:
-                return groups[0]["GroupId"]
-        return None  # noqa: TRY300
+            AlternateIdentifier={"UniqueAttribute": {"AttributePath": "DisplayName", "AttributeValue": group_name}},
+        )
     except ClientError as e:
-        logger.exception("Failed to get group", extra={"group_name": group_name, "error": str(e)})
-        return None
+        if e.response["Error"]["Code"] == "ResourceNotFoundException":
+            return None
+        # Raise anything else so lru_cache never keeps a transient failure as "not found".
+        raise
+    return response["GroupId"]
+
+
+@cache
+def _quick_suite_group_id_map(identity_store_id: str) -> dict[str, str]:
+    """Map the name of each Quick Suite group that exists in the Identity Store to its ID."""
+    group_ids = {group.value: get_group_id(identity_store_id, group.value) for group in QuickSuiteGroup}
+    return {group_name: group_id for group_name, group_id in group_ids.items() if group_id}
+
+
+@cache
+def _quick_suite_group_ids(identity_store_id: str) -> frozenset[str]:
+    """Resolve the IDs of the Quick Suite groups that exist in the Identity Store."""
+    return frozenset(_quick_suite_group_id_map(identity_store_id).values())
 
 
 def get_user_group_memberships(identity_store_id: str, user_id: str) -> list[dict]:
     """Get all Quick Suite group memberships for a user."""
+    # Resolved outside the try so a failed tier group lookup is raised instead of hiding memberships.
+    quick_suite_group_ids = _quick_suite_group_ids(identity_store_id)
     try:
-        paginator = identitystore.get_paginator("list_group_memberships_for_member")
+        paginator = _client("identitystore").get_paginator("list_group_memberships_for_member")
         memberships = []
 
         for page in paginator.paginate(IdentityStoreId=identity_store_id, MemberId={"UserId": user_id}):
             memberships.extend(page.get("GroupMemberships", []))
 
-        quick_suite_memberships = []
-        for membership in memberships:
-            group_id = membership["GroupId"]
-            try:
-                group = identitystore.describe_group(IdentityStoreId=identity_store_id, GroupId=group_id)
-                if group["DisplayName"] in [g.value for g in QuickSuiteGroup]:
-                    quick_suite_memberships.append(membership)
-            except ClientError:
-                continue
-
-        return quick_suite_memberships  # noqa: TRY300
+        return [membership for membership in memberships if membership["GroupId"] in quick_suite_group_ids]
     except ClientError as e:
         logger.exception("Failed to get user memberships", extra={"user_id": user_id, "error": str(e)})
         return []
 
 
-def remove_user_from_all_groups(identity_store_id: str, user_id: str) -> None:
-    """Remove user from all Quick Suite groups."""
-    memberships = get_user_group_memberships(identity_store_id, user_id)
+def _delete_group_membership(identity_store_id: str, user_id: str, membership: dict) -> None:
+    """Delete a single group membership, logging rather than raising on failure."""
+    try:
+        _client("identitystore").delete_group_membership(
+            IdentityStoreId=identity_store_id, MembershipId=membership["MembershipId"]
+        )
+        logger.info(
+            "Removed user from group",
+            extra={"user_id": user_id, "membership_id": membership["MembershipId"]},
+        )
+    except ClientError as e:
+        logger.warning(
+            "Failed to remove user from group",
+            extra={"user_id": user_id, "membership_id": membership["MembershipId"], "error": str(e)},
+        )
+
+
+def remove_user_from_all_groups(identity_store_id: str, user_id: str, memberships: list[dict] | None = None) -> None:
+    """Remove user from all Quick Suite groups, reusing already-fetched memberships when given."""
+    if memberships is None:
+        memberships = get_user_group_memberships(identity_store_id, user_id)
+    if not memberships:
+        return
 
-    for membership in memberships:
-        try:
-            identitystore.delete_group_membership(
-                IdentityStoreId=identity_store_id, MembershipId=membership["MembershipId"]
-            )
-            logger.info(
-                "Removed user from group",
-                extra={"user_id": user_id, "membership_id": membership["MembershipId"]},
-            )
-        except ClientError as e:
-            logger.warning(
-                "Failed to remove user from group",
-                extra={"user_id": user_id, "membership_id": membership["MembershipId"], "error": str(e)},
-            )
+    with ThreadPoolExecutor(max_workers=min(8, len(memberships))) as executor:
+        list(executor.map(partial(_delete_group_membership, identity_store_id, user_id), memberships))
 
 
-def create_or_update_user(identity_store_id: str, request: CreateUserRequest) -> str:
-    """Create or update a user (idempotent)."""
+def create_or_update_user(
+    identity_store_id: str, request: CreateUserRequest, group_id_map: dict[str, str] | None = None
+) -> str:
+    """Create or update a user (idempotent), resolving groups from group_id_map when given."""
     existing_user = get_user_by_username(identity_store_id, request.username)
 
     if existing_user:
@@ -164,7 +214,7 @@ def create_or_update_user(identity_store_id: str, request: CreateUserRequest) ->
         click.echo(f"⚠ User already exists: {request.username} (ID: {user_id})")
     else:
         try:
-            response = identitystore.create_user(
+            response = _client("identitystore").create_user(
                 IdentityStoreId=identity_store_id,
                 UserName=request.username,
                 Name={"GivenName": request.given_name, "FamilyName": request.family_name},
@@ -180,34 +230,144 @@ def create_or_update_user(identity_store_id: str, request: CreateUserRequest) ->
             raise
 
     if request.group:
-        remove_user_from_all_groups(identity_store_id, user_id)
-
-        group_id = get_group_id(identity_store_id, request.group)
+        try:
+            if group_id_map is None:
+                group_id_map = _quick_suite_group_id_map(identity_store_id)
+        except ClientError as e:
+            logger.exception("Failed to get groups", extra={"username": request.username, "error": str(e)})
+            click.echo(f"✗ Failed to look up group {request.group} for {request.username}: {e}", err=True)
+            raise
+        group_id = group_id_map.get(request.group)
         if not group_id:
             logger.error("Group not found", extra={"group_name": request.group})
-            click.echo(f"✗ Group not found: {request.group}. Run 'setup-groups' first.", err=True)
+            click.echo(
+                f"✗ Group not found for {request.username}: {request.group}. Run 'setup-groups' first.", err=True
+            )
             return user_id
 
+        # New users cannot have memberships yet, so only existing users need their groups reconciled.
+        if existing_user:
+            memberships = get_user_group_memberships(identity_store_id, user_id)
+            if len(memberships) == 1 and memberships[0]["GroupId"] == group_id:
+                logger.info("User already in group", extra={"user_id": user_id, "group_name": request.group})
+                click.echo(f"⚠ User {request.username} already in group: {request.group}")
+                return user_id
+            remove_user_from_all_groups(identity_store_id, user_id, memberships)
+
         try:
-            identitystore.create_group_membership(
+            _client("identitystore").create_group_membership(
                 IdentityStoreId=identity_store_id, GroupId=group_id, MemberId={"UserId": user_id}
             )
             logger.info("Added user to group", extra={"user_id": user_id, "group_name": request.group})
-            click.echo(f"✓ Added user to group: {request.group}")
+            click.echo(f"✓ Added user {request.username} to group: {request.group}")
         except ClientError as e:
             if e.response["Error"]["Code"] == "ConflictException":
                 logger.info("User already in group", extra={"user_id": user_id, "group_name": request.group})
-                click.echo(f"⚠ User already in group: {request.group}")
+                click.echo(f"⚠ User {request.username} already in group: {request.group}")
             else:
                 logger.warning(
                     "Failed to add user to group",
                     extra={"user_id": user_id, "group_name": request.group, "error": str(e)},
                 )
-                click.echo(f"⚠ Failed to add user to group: {e}")
+                click.echo(f"⚠ Failed to add user {request.username} to group {request.group}: {e}")
 
     return user_id
 
 
+def _create_tier_group(identity_store_id: str, tier: QuickSuiteGroup) -> tuple[str, str]:
+    """Create the Identity Store group for a pricing tier and return its status and name."""
+    try:
+        response = _client("identitystore").create_group(
+            IdentityStoreId=identity_store_id,
+            DisplayName=tier.value,
+            Description=f"Quick Suite {tier.name} tier users",
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ConflictException":
+            logger.info("Group already exists", extra={"group_name": tier.value})
+            click.echo(f"⚠ Group already exists: {tier.value}")
+            return "skipped", tier.value
+        logger.warning("Failed to create group", extra={"group_name": tier.value, "error": str(e)})
+        click.echo(f"⚠ Failed to create group {tier.value}: {e}")
+        return "failed", tier.value
+
+    logger.info(
+        "Created group",
+        extra={"group_name": tier.value, "group_id": response["GroupId"]},
+    )
+    click.echo(f"✓ Created group: {tier.value} (ID: {response['GroupId']})")
+    return "created", tier.value
+
+
+def _assign_group_to_role(account_id: str, namespace: str, group: QuickSuiteGroup) -> tuple[str, str]:
+    """Assign a pricing tier group to its Quick Suite role and return its status and name."""
+    group_name = group.value
+    role = QUICKSIGHT_ROLE_MAPPING[group_name]
+
+    try:
+        _client("quicksight").create_role_membership(
+            MemberName=group_name,
+            AwsAccountId=account_id,
+            Namespace=namespace,
+            Role=role,
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ResourceExistsException":
+            logger.info("Group already assigned", extra={"group": group_name, "role": role})
+            click.echo(f"⚠ {group_name} already assigned to {role}")
+            return "skipped", group_name
+        logger.exception(
+            "Failed to assign group",
+            extra={"group": group_name, "role": role, "error": str(e)},
+        )
+        click.echo(f"✗ Failed to assign {group_name}: {e}")
+        return "failed", group_name
+
+    logger.info(
+        "Assigned group to Quick Suite role",
+        extra={"group": group_name, "role": role, "namespace": namespace},
+    )
+    click.echo(f"✓ Assigned {group_name} → {role}")
+    return "created", group_name
+
+
+def _create_or_update_user_after(
+    previous: Future | None, identity_store_id: str, request: CreateUserRequest, group_id_map: dict[str, str]
+) -> str:
+    """Create or update a user once the previous entry for the same username, if any, has finished."""
+    # Entries for one user must apply in file order, or concurrent group reconciliation can leave two tiers.
+    if previous is not None:
+        wait([previous])
+    return create_or_update_user(identity_store_id, request, group_id_map)
+
+
+def _count_results(futures: Iterable[Future]) -> tuple[int, int]:
+    """Return the number of succeeded and failed user futures, waiting for any still running."""
+    futures = list(futures)
+    failed = sum(1 for future in futures if future.exception() is not None)
+    return len(futures) - failed, failed
+
+
+def _check_users_file_shape(events: Iterable[tuple[str, str, object]]) -> Iterator[tuple[str, str, object]]:
+    """Pass ijson parse events through, raising JSONError unless the document is an object with a "users" array."""
+    has_users = False
+    for prefix, event, value in events:
+        if not prefix and event == "start_array":
+            raise ijson.JSONError("expected a JSON object with a 'users' array, got an array")
+        if prefix == "users" and event != "end_array":
+            if event != "start_array":
+                raise ijson.JSONError("'users' must be an array")
+            has_users = True
+        yield prefix, event, value
+    if not has_users:
+        raise ijson.JSONError("missing top-level 'users' array")
+
+
+def _iter_users_file(f: BinaryIO) -> Iterator[dict]:
+    """Yield each raw entry of a users file's "users" array as it is parsed."""
+    return ijson.items(_check_users_file_shape(ijson.parse(f)), "users.item")
+
+
 @click.group()
 def cli() -> None:
     """Manage IAM Identity Center users and groups."""
@@ -221,25 +381,14 @@ def setup_groups(identity_store_id: str | None) -> None:
     if not identity_store_id:
         identity_store_id = get_identity_store_id()
 
-    for tier in QuickSuiteGroup:
-        try:
-            response = identitystore.create_group(
-                IdentityStoreId=identity_store_id,
-                DisplayName=tier.value,
-                Description=f"Quick Suite {tier.name} tier users",
-            )
-            logger.info(
-                "Created group",
-                extra={"group_name": tier.value, "group_id": response["GroupId"]},
-            )
-            click.echo(f"✓ Created group: {tier.value} (ID: {response['GroupId']})")
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "ConflictException":
-                logger.info("Group already exists", extra={"group_name": tier.value})
-                click.echo(f"⚠ Group already exists: {tier.value}")
-            else:
-                logger.warning("Failed to create group", extra={"group_name": tier.value, "error": str(e)})
-                click.echo(f"⚠ Failed to create group {tier.value}: {e}")
+    with ThreadPoolExecutor(max_workers=len(QuickSuiteGroup)) as executor:
+        create = partial(_create_tier_group, identity_store_id)
+        statuses = [status for status, _ in executor.map(create, QuickSuiteGroup)]
+
+    click.echo(
+        f"\nSummary: {statuses.count('created')} created, {statuses.count('skipped')} skipped, "
+        f"{statuses.count('failed')} failed"
+    )
 
 
 @cli.command()
@@ -292,29 +441,66 @@ def sync_users(file_path: str, identity_store_id: str | None) -> None:
     if not identity_store_id:
         identity_store_id = get_identity_store_id()
 
-    try:
-        with Path(file_path).open() as f:
-            data = json.load(f)
-        users_file = UsersFile.model_validate(data)
-    except Exception as e:
-        logger.error("Failed to parse users file", extra={"file": file_path, "error": str(e)})
-        click.echo(f"✗ Failed to parse users file: {e}", err=True)
-        sys.exit(1)
-
-    click.echo(f"\nProcessing {len(users_file.users)} user(s)...\n")
+    click.echo(f"\nProcessing users from {file_path}...\n")
 
     success_count = 0
     error_count = 0
+    parse_failed = False
+    # In-flight futures mapped to their username, and the latest in-flight future for each username.
+    pending: dict[Future, str] = {}
+    latest_by_username: dict[str, Future] = {}
+    # Resolve the tier groups once up front instead of once per user inside the workers.
+    try:
+        group_id_map = _quick_suite_group_id_map(identity_store_id)
+    except ClientError as e:
+        logger.exception("Failed to get groups", extra={"error": str(e)})
+        click.echo(f"✗ Failed to look up Quick Suite groups: {e}", err=True)
+        sys.exit(1)
 
-    for user_request in users_file.users:
+    # Users are validated and submitted as they are parsed, so the file is never held in memory as a whole.
+    with Path(file_path).open("rb") as f, ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
         try:
-            create_or_update_user(identity_store_id, user_request)
-            success_count += 1
-        except Exception:
-            error_count += 1
-        click.echo()
-
-    click.echo(f"Summary: {success_count} successful, {error_count} failed")
+            for index, raw_user in enumerate(_iter_users_file(f)):
+                try:
+                    user_request = CreateUserRequest.model_validate(raw_user)
+                except ValidationError as e:
+                    logger.error("Invalid user data", extra={"file": file_path, "index": index, "error": str(e)})
+                    click.echo(f"✗ Invalid user data at index {index}: {e}", err=True)
+                    error_count += 1
+                    continue
+
+                username = user_request.username
+                future = executor.submit(
+                    _create_or_update_user_after,
+                    latest_by_username.get(username),
+                    identity_store_id,
+                    user_request,
+                    group_id_map,
+                )
+                pending[future] = username
+                latest_by_username[username] = future
+
+                if len(pending) >= 2 * _MAX_WORKERS:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        username = pending.pop(future)
+                        if latest_by_username[username] is future:
+                            del latest_by_username[username]
+                    succeeded, failed = _count_results(done)
+                    success_count += succeeded
+                    error_count += failed
+        except ijson.JSONError as e:
+            logger.error("Failed to parse users file", extra={"file": file_path, "error": str(e)})
+            click.echo(f"✗ Failed to parse users file: {e}", err=True)
+            parse_failed = True
+
+    succeeded, failed = _count_results(pending)
+    success_count += succeeded
+    error_count += failed
+
+    click.echo(f"\nSummary: {success_count} successful, {error_count} failed")
+    if parse_failed:
+        sys.exit(1)
 
 
 @cli.command()
@@ -339,7 +525,7 @@ def delete_user(user_id: str | None, username: str | None, identity_store_id: st
         user_id = user["UserId"]
 
     try:
-        identitystore.delete_user(IdentityStoreId=identity_store_id, UserId=user_id)
+        _client("identitystore").delete_user(IdentityStoreId=identity_store_id, UserId=user_id)
         logger.info("Deleted user", extra={"user_id": user_id})
         click.echo(f"✓ Deleted user: {user_id}")
     except ClientError as e:
@@ -363,16 +549,20 @@ def add_user_to_group(user_id: str, group_name: str, identity_store_id: str | No
     if not identity_store_id:
         identity_store_id = get_identity_store_id()
 
-    remove_user_from_all_groups(identity_store_id, user_id)
-
-    group_id = get_group_id(identity_store_id, group_name)
+    try:
+        remove_user_from_all_groups(identity_store_id, user_id)
+        group_id = get_group_id(identity_store_id, group_name)
+    except ClientError as e:
+        logger.exception("Failed to get groups", extra={"user_id": user_id, "error": str(e)})
+        click.echo(f"✗ Failed to look up Quick Suite groups: {e}", err=True)
+        sys.exit(1)
     if not group_id:
         logger.error("Group not found", extra={"group_name": group_name})
         click.echo(f"✗ Group not found: {group_name}. Run 'setup-groups' first.", err=True)
         sys.exit(1)
 
     try:
-        response = identitystore.create_group_membership(
+        response = _client("identitystore").create_group_membership(
             IdentityStoreId=identity_store_id, GroupId=group_id, MemberId={"UserId": user_id}
         )
 
@@ -405,29 +595,32 @@ def list_users(identity_store_id: str | None) -> None:
         identity_store_id = get_identity_store_id()
 
     try:
-        paginator = identitystore.get_paginator("list_users")
-        users = []
+        paginator = _client("identitystore").get_paginator("list_users")
+        count = 0
 
         for page in paginator.paginate(IdentityStoreId=identity_store_id):
-            users.extend(page.get("Users", []))
-
-        if not users:
+            for user in page.get("Users", []):
+                if not count:
+                    click.echo("\nUsers:\n")
+                count += 1
+
+                user_id = user["UserId"]
+                username = user.get("UserName", "N/A")
+                display_name = user.get("DisplayName", "N/A")
+                emails = user.get("Emails", [])
+                email = emails[0]["Value"] if emails else "N/A"
+
+                click.echo(f"User ID: {user_id}")
+                click.echo(f"  Username: {username}")
+                click.echo(f"  Display Name: {display_name}")
+                click.echo(f"  Email: {email}")
+                click.echo()
+
+        if not count:
             click.echo("No users found")
             return
 
-        click.echo(f"\nFound {len(users)} user(s):\n")
-        for user in users:
-            user_id = user["UserId"]
-            username = user.get("UserName", "N/A")
-            display_name = user.get("DisplayName", "N/A")
-            emails = user.get("Emails", [])
-            email = emails[0]["Value"] if emails else "N/A"
-
-            click.echo(f"User ID: {user_id}")
-            click.echo(f"  Username: {username}")
-            click.echo(f"  Display Name: {display_name}")
-            click.echo(f"  Email: {email}")
-            click.echo()
+        click.echo(f"Total: {count} user(s)")
     except ClientError as e:
         logger.exception("Failed to list users", extra={"error": str(e)})
         click.echo(f"✗ Failed to list users: {e}", err=True)
@@ -442,26 +635,29 @@ def list_groups(identity_store_id: str | None) -> None:
         identity_store_id = get_identity_store_id()
 
     try:
-        paginator = identitystore.get_paginator("list_groups")
-        groups = []
+        paginator = _client("identitystore").get_paginator("list_groups")
+        count = 0
 
         for page in paginator.paginate(IdentityStoreId=identity_store_id):
-            groups.extend(page.get("Groups", []))
+            for group in page.get("Groups", []):
+                if not count:
+                    click.echo("\nGroups:\n")
+                count += 1
+
+                group_id = group["GroupId"]
+                display_name = group.get("DisplayName", "N/A")
+                description = group.get("Description", "N/A")
+
+                click.echo(f"Group ID: {group_id}")
+                click.echo(f"  Name: {display_name}")
+                click.echo(f"  Description: {description}")
+                click.echo()
 
-        if not groups:
+        if not count:
             click.echo("No groups found")
             return
 
-        click.echo(f"\nFound {len(groups)} group(s):\n")
-        for group in groups:
-            group_id = group["GroupId"]
-            display_name = group.get("DisplayName", "N/A")
-            description = group.get("Description", "N/A")
-
-            click.echo(f"Group ID: {group_id}")
-            click.echo(f"  Name: {display_name}")
-            click.echo(f"  Description: {description}")
-            click.echo()
+        click.echo(f"Total: {count} group(s)")
     except ClientError as e:
         logger.exception("Failed to list groups", extra={"error": str(e)})
         click.echo(f"✗ Failed to list groups: {e}", err=True)
@@ -472,45 +668,18 @@ def list_groups(identity_store_id: str | None) -> None:
 @click.option("--namespace", default="default", help="Quick Suite namespace (default: default)")
 def assign_groups_to_quick_suite(namespace: str) -> None:
     """Assign Identity Center groups to Quick Suite roles (idempotent)."""
-    account_id = sts.get_caller_identity()["Account"]
+    account_id = _client("sts").get_caller_identity()["Account"]
 
     click.echo(f"\nAssigning groups to Quick Suite roles in namespace '{namespace}'...\n")
 
-    success_count = 0
-    skip_count = 0
-    error_count = 0
-
-    for group in QuickSuiteGroup:
-        group_name = group.value
-        role = QUICKSIGHT_ROLE_MAPPING[group_name]
-
-        try:
-            quicksight.create_role_membership(
-                MemberName=group_name,
-                AwsAccountId=account_id,
-                Namespace=namespace,
-                Role=role,
-            )
-            logger.info(
-                "Assigned group to Quick Suite role",
-                extra={"group": group_name, "role": role, "namespace": namespace},
-            )
-            click.echo(f"✓ Assigned {group_name} → {role}")
-            success_count += 1
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "ResourceExistsException":
-                logger.info("Group already assigned", extra={"group": group_name, "role": role})
-                click.echo(f"⚠ {group_name} already assigned to {role}")
-                skip_count += 1
-            else:
-                logger.exception(
-                    "Failed to assign group",
-                    extra={"group": group_name, "role": role, "error": str(e)},
-                )
-                click.echo(f"✗ Failed to assign {group_name}: {e}")
-                error_count += 1
+    with ThreadPoolExecutor(max_workers=len(QuickSuiteGroup)) as executor:
+        assign = partial(_assign_group_to_role, account_id, namespace)
+        statuses = [status for status, _ in executor.map(assign, QuickSuiteGroup)]
 
-    click.echo(f"\nSummary: {success_count} assigned, {skip_count} skipped, {error_count} failed")
+    click.echo(
+        f"\nSummary: {statuses.count('created')} assigned, {statuses.count('skipped')} skipped, "
+        f"{statuses.count('failed')} failed"
+    )
 
 
 if __name__ == "__main__":
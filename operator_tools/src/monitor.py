@@ -1,178 +1,520 @@
 """CLI tool for monitoring Quick Suite usage and users."""
 
+import json
+import os
+import shlex
 import sys
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import boto3
 import click
 from botocore.exceptions import ClientError
 from common.observability import logger
 
-quicksight = boto3.client("quicksight")
-sts = boto3.client("sts")
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+    from botocore.config import Config
+
+_client_lock = threading.Lock()
+_clients: dict[str, "BaseClient"] = {}
+
+
+@cache
+def _config() -> "Config":
+    """Build the shared client config on first use; importing botocore.config pulls in most of botocore."""
+    from botocore.config import Config  # noqa: PLC0415
+
+    return Config(
+        max_pool_connections=32,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        tcp_keepalive=True,
+        user_agent_extra="qs-operator-tools/1.0",
+    )
+
+
+def _client(service_name: str) -> "BaseClient":
+    """Create a boto3 client on first use so --help and argument errors skip importing boto3."""
+    client = _clients.get(service_name)
+    if client is not None:
+        return client
+
+    import boto3  # noqa: PLC0415
+
+    # The default session is not thread-safe, and threads racing on the first call must share one client
+    # (and its connection pool), so check again and build under the lock.
+    with _client_lock:
+        client = _clients.get(service_name)
+        if client is None:
+            client = _clients[service_name] = boto3.client(service_name, config=_config())
+    return client
+
+
+def _quicksight() -> "BaseClient":
+    """Get the shared QuickSight client."""
+    return _client("quicksight")
+
+
+def _sts() -> "BaseClient":
+    """Get the shared STS client."""
+    return _client("sts")
+
+
+# Roles a QuickSight user can hold, as returned in ListUsers.
+_USER_ROLES = (
+    "ADMIN",
+    "AUTHOR",
+    "READER",
+    "RESTRICTED_AUTHOR",
+    "RESTRICTED_READER",
+    "ADMIN_PRO",
+    "AUTHOR_PRO",
+    "READER_PRO",
+)
+
+# Largest page QuickSight returns for ListUsers, ListGroups, ListGroupMemberships and ListNamespaces.
+_MAX_PAGE_SIZE = 100
+
+# Namespaces paginated at once by list-users; each holds one connection from the client pool.
+_MAX_NAMESPACE_WORKERS = 8
+
+IDENTITY_CACHE_FILE = Path.home() / ".cache" / "quicksuite" / "account_id.json"
+
+
+def _identity_cache_key() -> str:
+    """Key identity cache entries by the credentials in use."""
+    access_key_id = os.environ.get("AWS_ACCESS_KEY_ID")
+    if access_key_id:
+        return f"access-key:{access_key_id}"
+    # Same precedence botocore uses when resolving the profile.
+    profile = os.environ.get("AWS_DEFAULT_PROFILE") or os.environ.get("AWS_PROFILE") or "default"
+    return f"profile:{profile}"
+
+
+def _read_identity_cache() -> dict[str, str]:
+    """Read the identity cache file, treating a missing or unreadable file as empty."""
+    try:
+        identity_cache = json.loads(IDENTITY_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return identity_cache if isinstance(identity_cache, dict) else {}
+
+
+def _write_identity_cache(identity_cache: dict[str, str]) -> None:
+    """Atomically replace the identity cache file."""
+    tmp_file = IDENTITY_CACHE_FILE.with_name(f"{IDENTITY_CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        IDENTITY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(identity_cache))
+        os.replace(tmp_file, IDENTITY_CACHE_FILE)
+    except OSError as e:
+        logger.warning("Failed to write identity cache", extra={"file": str(IDENTITY_CACHE_FILE), "error": str(e)})
+
+
+def _use_identity_cache() -> bool:
+    """Whether --no-identity-cache was left unset; only meaningful on the thread running the command."""
+    ctx = click.get_current_context(silent=True)
+    return not (ctx and ctx.find_root().params.get("no_identity_cache"))
+
+
+@cache
+def _get_account_id() -> str:
+    """Get the AWS account ID from AWS_ACCOUNT_ID, the identity cache or STS, in that order."""
+    account_id = os.environ.get("AWS_ACCOUNT_ID")
+    if account_id:
+        return account_id
+
+    use_identity_cache = _use_identity_cache()
+    cache_key = _identity_cache_key()
+    identity_cache = _read_identity_cache() if use_identity_cache else {}
+
+    account_id = identity_cache.get(cache_key)
+    if account_id:
+        return account_id
+
+    account_id = _sts().get_caller_identity()["Account"]
+    if use_identity_cache:
+        identity_cache[cache_key] = account_id
+        _write_identity_cache(identity_cache)
+    return account_id
+
+
+def _forget_account_id_if_denied(error: ClientError) -> None:
+    """Drop the cached account ID after QuickSight denies access, in case it belongs to other credentials."""
+    if error.response["Error"]["Code"] != "AccessDeniedException":
+        return
+
+    _get_account_id.cache_clear()
+    if os.environ.get("AWS_ACCOUNT_ID") or not _use_identity_cache():
+        return
+
+    identity_cache = _read_identity_cache()
+    if identity_cache.pop(_identity_cache_key(), None) is not None:
+        _write_identity_cache(identity_cache)
+        click.echo("⚠ Cleared the cached account ID; the next command will look it up again.", err=True)
+
+
+def _iter_pages(operation: str, **kwargs: str) -> Iterator[dict]:
+    """Yield pages of a QuickSight list operation, fetching the next page while the caller handles the current one."""
+    list_page = partial(getattr(_quicksight(), operation), **kwargs, MaxResults=_MAX_PAGE_SIZE)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_page = executor.submit(list_page)
+        while next_page is not None:
+            page = next_page.result()
+            next_token = page.get("NextToken")
+            next_page = executor.submit(list_page, NextToken=next_token) if next_token else None
+            yield page
+
+
+def _iter_items(operation: str, result_key: str, **kwargs: str) -> Iterator[dict]:
+    """Yield the items of a QuickSight list operation one page at a time."""
+    for page in _iter_pages(operation, **kwargs):
+        yield from page.get(result_key, [])
+
+
+def _summarize_users(account_id: str, namespace: str) -> tuple[int, int, Counter]:
+    """Count users, active users and users per role in a namespace without keeping the user list."""
+    total = 0
+    active = 0
+    role_counts = Counter()
+    for page in _iter_pages("list_users", AwsAccountId=account_id, Namespace=namespace):
+        user_list = page.get("UserList", [])
+        total += len(user_list)
+        active += sum(1 for user in user_list if user.get("Active", False))
+        role_counts.update(user.get("Role", "UNKNOWN") for user in user_list)
+    return total, active, role_counts
+
+
+def _count_groups(account_id: str, namespace: str) -> int:
+    """Count the groups in a namespace."""
+    pages = _iter_pages("list_groups", AwsAccountId=account_id, Namespace=namespace)
+    return sum(len(page.get("GroupList", [])) for page in pages)
+
+
+def _write_json_array(items: Iterable[dict]) -> int:
+    """Stream items to stdout as one JSON array without holding them all in memory, returning the count."""
+    write = sys.stdout.write
+    count = 0
+    for item in items:
+        write("," if count else "[")
+        write(json.dumps(item, default=str, separators=(",", ":")))
+        count += 1
+    write("]\n" if count else "[]\n")
+    return count
+
+
+def _iter_users(account_id: str, namespace: str, active_only: bool, role: str | None) -> Iterator[dict]:
+    """Yield the users in a namespace that match the list-users filters."""
+    users = _iter_items("list_users", "UserList", AwsAccountId=account_id, Namespace=namespace)
+    if not (active_only or role):
+        return users
+    # ListUsers has no server-side filter, so skip non-matching users before any formatting.
+    return (
+        user
+        for user in users
+        if (not active_only or user.get("Active", False)) and (not role or user.get("Role") == role)
+    )
+
+
+def _fetch_users(account_id: str, namespace: str, active_only: bool, role: str | None) -> list[dict]:
+    """Get the users in a namespace that match the list-users filters."""
+    return list(_iter_users(account_id, namespace, active_only, role))
+
+
+def _with_namespace(namespace: str, users: Iterable[dict]) -> Iterator[dict]:
+    """Add the namespace to each user record, since ListUsers does not include it."""
+    return ({**user, "Namespace": namespace} for user in users)
+
+
+def _echo_users(namespace: str, users: Iterable[dict]) -> None:
+    """Print users with their roles and a per-role summary."""
+    count = 0
+    role_counts = Counter()
+
+    for user in users:
+        get = user.get
+        user_role = get("Role", "N/A")
+
+        if not count:
+            click.echo(f"\nUsers in namespace '{namespace}':\n")
+        count += 1
+
+        username = get("UserName", "N/A")
+        email = get("Email", "N/A")
+        status = "Active" if get("Active", False) else "Inactive"
+
+        role_counts[user_role] += 1
+
+        click.echo(f"Username: {username}\n  Email: {email}\n  Role: {user_role}\n  Status: {status}\n")
+
+    if not count:
+        click.echo(f"No users found in namespace '{namespace}'")
+        return
+
+    click.echo(f"Total: {count} user(s)\n")
+    click.echo("Summary by Role:")
+    for user_role, role_count in sorted(role_counts.items()):
+        click.echo(f"  {user_role}: {role_count}")
+
+
+output_option = click.option(
+    "--output",
+    "-o",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format; json writes the raw API records for scripts",
+)
 
 
 @click.group()
-def cli() -> None:
+@click.option(
+    "--no-identity-cache",
+    is_flag=True,
+    help=f"Always call STS for the account ID instead of reading or writing {IDENTITY_CACHE_FILE}",
+)
+def cli(no_identity_cache: bool) -> None:
     """Monitor Quick Suite usage and users."""
     pass
 
 
 @cli.command()
-@click.option("--namespace", default="default", help="Quick Suite namespace (default: default)")
-def list_users(namespace: str) -> None:
+@click.option(
+    "--namespace",
+    default="default",
+    help="Quick Suite namespace, or a comma-separated list of namespaces (default: default)",
+)
+@click.option("--all-namespaces", is_flag=True, help="List users in every namespace in the account")
+@click.option("--active-only", is_flag=True, help="Only list active users")
+@click.option(
+    "--role",
+    type=click.Choice(_USER_ROLES, case_sensitive=False),
+    help="Only list users with this role",
+)
+@output_option
+def list_users(namespace: str, all_namespaces: bool, active_only: bool, role: str | None, output: str) -> None:
     """List all Quick Suite users with their roles."""
-    account_id = sts.get_caller_identity()["Account"]
+    account_id = _get_account_id()
 
     try:
-        paginator = quicksight.get_paginator("list_users")
-        users = []
-
-        for page in paginator.paginate(AwsAccountId=account_id, Namespace=namespace):
-            users.extend(page.get("UserList", []))
-
-        if not users:
-            click.echo("No users found")
+        if all_namespaces:
+            namespaces = [
+                ns["Name"]
+                for ns in _iter_items("list_namespaces", "Namespaces", AwsAccountId=account_id)
+                if ns.get("CreationStatus") == "CREATED"
+            ]
+        else:
+            namespaces = list(dict.fromkeys(ns.strip() for ns in namespace.split(",") if ns.strip()))
+
+        if not namespaces:
+            if output == "json":
+                _write_json_array(())
+            click.echo("No namespaces found", err=output == "json")
             return
 
-        click.echo(f"\nFound {len(users)} user(s) in namespace '{namespace}':\n")
-
-        role_counts = {}
-        for user in users:
-            username = user.get("UserName", "N/A")
-            email = user.get("Email", "N/A")
-            role = user.get("Role", "N/A")
-            active = user.get("Active", False)
-            status = "Active" if active else "Inactive"
-
-            role_counts[role] = role_counts.get(role, 0) + 1
-
-            click.echo(f"Username: {username}")
-            click.echo(f"  Email: {email}")
-            click.echo(f"  Role: {role}")
-            click.echo(f"  Status: {status}")
-            click.echo()
+        if len(namespaces) == 1:
+            users = _iter_users(account_id, namespaces[0], active_only, role)
+            if output == "json":
+                _write_json_array(_with_namespace(namespaces[0], users))
+            else:
+                _echo_users(namespaces[0], users)
+            return
 
-        click.echo("Summary by Role:")
-        for role, count in sorted(role_counts.items()):
-            click.echo(f"  {role}: {count}")
+        # Paginate the namespaces concurrently, then print them in the order given, grouped by namespace.
+        fetch_users = partial(_fetch_users, account_id, active_only=active_only, role=role)
+        with ThreadPoolExecutor(max_workers=min(len(namespaces), _MAX_NAMESPACE_WORKERS)) as executor:
+            users_by_namespace = zip(namespaces, executor.map(fetch_users, namespaces), strict=True)
+            if output == "json":
+                _write_json_array(chain.from_iterable(_with_namespace(ns, users) for ns, users in users_by_namespace))
+                return
+            for ns, users in users_by_namespace:
+                _echo_users(ns, users)
 
     except ClientError as e:
         logger.exception("Failed to list users", extra={"error": str(e)})
         click.echo(f"✗ Failed to list users: {e}", err=True)
+        _forget_account_id_if_denied(e)
         sys.exit(1)
 
 
 @cli.command()
 @click.option("--namespace", default="default", help="Quick Suite namespace (default: default)")
-def list_groups(namespace: str) -> None:
+@output_option
+def list_groups(namespace: str, output: str) -> None:
     """List all Quick Suite groups."""
-    account_id = sts.get_caller_identity()["Account"]
+    account_id = _get_account_id()
 
     try:
-        paginator = quicksight.get_paginator("list_groups")
-        groups = []
+        groups = _iter_items("list_groups", "GroupList", AwsAccountId=account_id, Namespace=namespace)
 
-        for page in paginator.paginate(AwsAccountId=account_id, Namespace=namespace):
-            groups.extend(page.get("GroupList", []))
-
-        if not groups:
-            click.echo("No groups found")
+        if output == "json":
+            _write_json_array(groups)
             return
 
-        click.echo(f"\nFound {len(groups)} group(s) in namespace '{namespace}':\n")
+        count = 0
 
         for group in groups:
-            group_name = group.get("GroupName", "N/A")
-            arn = group.get("Arn", "N/A")
-            description = group.get("Description", "N/A")
+            if not count:
+                click.echo(f"\nGroups in namespace '{namespace}':\n")
+            count += 1
 
-            click.echo(f"Group: {group_name}")
-            click.echo(f"  Description: {description}")
-            click.echo(f"  ARN: {arn}")
-            click.echo()
+            get = group.get
+            group_name = get("GroupName", "N/A")
+            arn = get("Arn", "N/A")
+            description = get("Description", "N/A")
+
+            click.echo(f"Group: {group_name}\n  Description: {description}\n  ARN: {arn}\n")
+
+        if not count:
+            click.echo("No groups found")
+            return
+
+        click.echo(f"Total: {count} group(s)")
 
     except ClientError as e:
         logger.exception("Failed to list groups", extra={"error": str(e)})
         click.echo(f"✗ Failed to list groups: {e}", err=True)
+        _forget_account_id_if_denied(e)
         sys.exit(1)
 
 
 @cli.command()
 @click.option("--group-name", required=True, help="Group name to inspect")
 @click.option("--namespace", default="default", help="Quick Suite namespace (default: default)")
-def list_group_members(group_name: str, namespace: str) -> None:
+@output_option
+def list_group_members(group_name: str, namespace: str, output: str) -> None:
     """List all members of a Quick Suite group."""
-    account_id = sts.get_caller_identity()["Account"]
+    account_id = _get_account_id()
 
     try:
-        paginator = quicksight.get_paginator("list_group_memberships")
-        members = []
-
-        for page in paginator.paginate(GroupName=group_name, AwsAccountId=account_id, Namespace=namespace):
-            members.extend(page.get("GroupMemberList", []))
-
-        if not members:
-            click.echo(f"No members found in group '{group_name}'")
+        members = _iter_items(
+            "list_group_memberships",
+            "GroupMemberList",
+            GroupName=group_name,
+            AwsAccountId=account_id,
+            Namespace=namespace,
+        )
+
+        if output == "json":
+            _write_json_array(members)
             return
 
-        click.echo(f"\nFound {len(members)} member(s) in group '{group_name}':\n")
+        count = 0
 
         for member in members:
-            member_name = member.get("MemberName", "N/A")
-            arn = member.get("Arn", "N/A")
+            if not count:
+                click.echo(f"\nMembers of group '{group_name}':\n")
+            count += 1
 
-            click.echo(f"Member: {member_name}")
-            click.echo(f"  ARN: {arn}")
-            click.echo()
+            get = member.get
+            member_name = get("MemberName", "N/A")
+            arn = get("Arn", "N/A")
+
+            click.echo(f"Member: {member_name}\n  ARN: {arn}\n")
+
+        if not count:
+            click.echo(f"No members found in group '{group_name}'")
+            return
+
+        click.echo(f"Total: {count} member(s)")
 
     except ClientError as e:
         logger.exception("Failed to list group members", extra={"error": str(e)})
         click.echo(f"✗ Failed to list group members: {e}", err=True)
+        _forget_account_id_if_denied(e)
         sys.exit(1)
 
 
 @cli.command()
 @click.option("--namespace", default="default", help="Quick Suite namespace (default: default)")
-def account_summary(namespace: str) -> None:
+@output_option
+def account_summary(namespace: str, output: str) -> None:
     """Display Quick Suite account summary."""
-    account_id = sts.get_caller_identity()["Account"]
+    account_id = _get_account_id()
 
-    click.echo("\n=== Quick Suite Account Summary ===")
-    click.echo(f"Account ID: {account_id}")
-    click.echo(f"Namespace: {namespace}\n")
+    if output == "text":
+        click.echo("\n=== Quick Suite Account Summary ===")
+        click.echo(f"Account ID: {account_id}")
+        click.echo(f"Namespace: {namespace}\n")
 
     try:
-        paginator = quicksight.get_paginator("list_users")
-        users = []
-        for page in paginator.paginate(AwsAccountId=account_id, Namespace=namespace):
-            users.extend(page.get("UserList", []))
-
-        active_users = sum(1 for u in users if u.get("Active", False))
-        role_counts = {}
-        for user in users:
-            role = user.get("Role", "UNKNOWN")
-            role_counts[role] = role_counts.get(role, 0) + 1
-
-        click.echo(f"Total Users: {len(users)}")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            users_future = executor.submit(_summarize_users, account_id, namespace)
+            groups_future = executor.submit(_count_groups, account_id, namespace)
+            total_users, active_users, role_counts = users_future.result()
+            total_groups = groups_future.result()
+
+        if output == "json":
+            summary = {
+                "AccountId": account_id,
+                "Namespace": namespace,
+                "TotalUsers": total_users,
+                "ActiveUsers": active_users,
+                "InactiveUsers": total_users - active_users,
+                "UsersByRole": dict(sorted(role_counts.items())),
+                "TotalGroups": total_groups,
+            }
+            click.echo(json.dumps(summary))
+            return
+
+        click.echo(f"Total Users: {total_users}")
         click.echo(f"Active Users: {active_users}")
-        click.echo(f"Inactive Users: {len(users) - active_users}\n")
+        click.echo(f"Inactive Users: {total_users - active_users}\n")
 
         click.echo("Users by Role:")
         for role, count in sorted(role_counts.items()):
             click.echo(f"  {role}: {count}")
 
-        paginator = quicksight.get_paginator("list_groups")
-        groups = []
-        for page in paginator.paginate(AwsAccountId=account_id, Namespace=namespace):
-            groups.extend(page.get("GroupList", []))
-
-        click.echo(f"\nTotal Groups: {len(groups)}")
+        click.echo(f"\nTotal Groups: {total_groups}")
 
     except ClientError as e:
         logger.exception("Failed to get account summary", extra={"error": str(e)})
         click.echo(f"✗ Failed to get account summary: {e}", err=True)
+        _forget_account_id_if_denied(e)
         sys.exit(1)
 
 
+@cli.command()
+@click.pass_context
+def shell(ctx: click.Context) -> None:
+    """Run several commands in one session, reusing AWS connections and the account ID between them."""
+    root_args = ["--no-identity-cache"] if ctx.find_root().params["no_identity_cache"] else []
+    click.echo("Enter monitor commands (for example 'list-users --namespace default'), or 'exit' to quit.")
+
+    while True:
+        try:
+            line = click.prompt("monitor", default="", show_default=False, prompt_suffix="> ")
+        except click.Abort:
+            click.echo()
+            return
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            click.echo(f"✗ {e}", err=True)
+            continue
+
+        if not args:
+            continue
+        if args[0] in {"exit", "quit"}:
+            return
+        if args[0] == "shell":
+            click.echo("✗ Already in a monitor shell", err=True)
+            continue
+
+        try:
+            cli.main([*root_args, *args], prog_name="monitor", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except SystemExit:
+            # Commands exit non-zero on AWS errors after reporting them; keep the session alive.
+            pass
+
+
 if __name__ == "__main__":
     cli()